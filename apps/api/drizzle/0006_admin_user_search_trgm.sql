@@ -0,0 +1,8 @@
+-- Admin user search filters with ILIKE '%q%' on username/email, which a btree
+-- index cannot serve. Trigram GIN indexes turn the substring match into an
+-- index probe instead of a sequential scan over users.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "users_username_trgm_idx" ON "users" USING gin ("username" gin_trgm_ops);
+--> statement-breakpoint
+CREATE INDEX IF NOT EXISTS "users_email_trgm_idx" ON "users" USING gin ("email" gin_trgm_ops);
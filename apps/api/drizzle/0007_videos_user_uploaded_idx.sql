@@ -0,0 +1,8 @@
+-- The default video list filters on user_id only and orders by uploaded_at DESC.
+-- videos_user_status_uploaded_idx leads with status, so without a status filter
+-- Postgres had to fetch every row of the user and sort. This index serves the
+-- ORDER BY ... LIMIT directly and also covers plain user_id lookups, which makes
+-- the single-column videos_user_id_idx redundant.
+CREATE INDEX IF NOT EXISTS "videos_user_uploaded_idx" ON "videos" USING btree ("user_id","uploaded_at" DESC NULLS FIRST);
+--> statement-breakpoint
+DROP INDEX IF EXISTS "videos_user_id_idx";
@@ -0,0 +1,8 @@
+-- Tag lists filter on user_id and order by name. The unique constraint is on
+-- (name, user_id), which leads with name and cannot serve that scan, so Postgres
+-- read every tag of the user through tags_user_id_idx and sorted them. A
+-- (user_id, name) index returns the page already ordered and covers plain
+-- user_id lookups, so tags_user_id_idx is dropped.
+CREATE INDEX IF NOT EXISTS "tags_user_name_idx" ON "tags" USING btree ("user_id","name");
+--> statement-breakpoint
+DROP INDEX IF EXISTS "tags_user_id_idx";
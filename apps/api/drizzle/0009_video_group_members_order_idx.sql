@@ -0,0 +1,10 @@
+-- Group members are read with ORDER BY "order", added_at per group. Extending the
+-- (group_id, "order") index with added_at lets ties come back in index order
+-- without an incremental sort. group_id lookups are already served by this
+-- index and by video_group_members_group_video_uniq, so the single-column
+-- index is dropped.
+CREATE INDEX IF NOT EXISTS "video_group_members_group_order_added_idx" ON "video_group_members" USING btree ("group_id","order","added_at");
+--> statement-breakpoint
+DROP INDEX IF EXISTS "video_group_members_group_order_idx";
+--> statement-breakpoint
+DROP INDEX IF EXISTS "video_group_members_group_id_idx";
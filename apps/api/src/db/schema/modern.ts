@@ -84,6 +84,8 @@ export const users = pgTable(
 			table.isActive.asc().nullsLast(),
 		),
 		index("users_deactivated_at_idx").using("btree", table.deactivatedAt.asc().nullsLast()),
+		index("users_username_trgm_idx").using("gin", table.username.op("gin_trgm_ops")),
+		index("users_email_trgm_idx").using("gin", table.email.op("gin_trgm_ops")),
 		unique("users_username_key").on(table.username),
 		unique("users_email_key").on(table.email),
 		check("users_max_video_upload_size_mb_check", sql`max_video_upload_size_mb >= 0`),
@@ -148,7 +150,11 @@ export const videos = pgTable(
 		youtubeVideoId: varchar("youtube_video_id", { length: 32 }).notNull(),
 	},
 	(table) => [
-		index("videos_user_id_idx").using("btree", table.userId.asc().nullsLast()),
+		index("videos_user_uploaded_idx").using(
+			"btree",
+			table.userId.asc().nullsLast(),
+			table.uploadedAt.desc().nullsFirst(),
+		),
 		index("videos_status_idx").using("btree", table.status.asc().nullsLast()),
 		index("videos_uploaded_at_idx").using("btree", table.uploadedAt.asc().nullsLast()),
 		index("videos_user_status_uploaded_idx").using(
@@ -217,12 +223,12 @@ export const videoGroupMembers = pgTable(
 		videoId: bigint("video_id", { mode: "number" }).notNull(),
 	},
 	(table) => [
-		index("video_group_members_group_id_idx").using("btree", table.groupId.asc().nullsLast()),
 		index("video_group_members_video_id_idx").using("btree", table.videoId.asc().nullsLast()),
-		index("video_group_members_group_order_idx").using(
+		index("video_group_members_group_order_added_idx").using(
 			"btree",
 			table.groupId.asc().nullsLast(),
 			table.order.asc().nullsLast(),
+			table.addedAt.asc().nullsLast(),
 		),
 		foreignKey({
 			columns: [table.groupId],
@@ -255,7 +261,11 @@ export const tags = pgTable(
 		userId: bigint("user_id", { mode: "number" }).notNull(),
 	},
 	(table) => [
-		index("tags_user_id_idx").using("btree", table.userId.asc().nullsLast()),
+		index("tags_user_name_idx").using(
+			"btree",
+			table.userId.asc().nullsLast(),
+			table.name.asc().nullsLast(),
+		),
 		foreignKey({
 			columns: [table.userId],
 			foreignColumns: [users.id],
@@ -96,7 +96,8 @@ export async function reorderGroupVideos(
     } as const;
   }
 
-  await reorderVideos(env, groupId, videoIds);
+  // 空グループへの空配列は並べ替え対象が無いので、ロック付き tx を張らない。
+  if (videoIds.length > 0) await reorderVideos(env, groupId, videoIds);
   return { ok: true as const, message: "Video order updated" };
 }
 
@@ -11,10 +11,7 @@ import {
   createYoutubeVideo,
 } from "../../repositories/video-repository";
 import { validateTranscriptSrt } from "../../lib/srt";
-import {
-  syncVectorTitle,
-  deleteVideoVectors,
-} from "../../repositories/vector-repository";
+import { syncVectorTitle } from "../../repositories/vector-repository";
 import { enqueueReindexTranscript, enqueueTranscription } from "../../lib/jobs";
 import {
   incrementStorageBytes,
@@ -56,11 +53,15 @@ export type MultipartVideoResult =
 
 export function parseTagIds(tagsParam: string | undefined): number[] | null {
   if (!tagsParam?.trim()) return null;
-  const parsed = tagsParam
-    .split(",")
-    .filter(Boolean)
-    .map((t) => Number(t));
-  return parsed.every((n) => Number.isInteger(n)) ? parsed : null;
+  // split → filter → map → every の多段パスを 1 ループにまとめ、不正値で即打ち切る。
+  const parsed: number[] = [];
+  for (const part of tagsParam.split(",")) {
+    if (!part) continue;
+    const n = Number(part);
+    if (!Number.isInteger(n)) return null;
+    parsed.push(n);
+  }
+  return parsed;
 }
 
 export async function listUserVideos(
@@ -275,19 +276,21 @@ export async function deleteUserVideo(
   const deleted = await deleteVideoCascade(env, videoId, userId);
   if (!deleted) return { notFound: true } as const;
 
-  await deleteVideoVectors(env, videoId).catch((error) => {
-    reportBestEffortFailure("delete_video_vectors", error);
-  });
-  if (info.fileKey) {
-    await deleteR2Object(env, info.fileKey).catch((error) => {
-      reportBestEffortFailure("delete_video_object", error);
-    });
-  }
-  if (fileSize !== null) {
-    await incrementStorageBytes(env, userId, -fileSize).catch((error) => {
-      reportBestEffortFailure("release_storage_bytes", error);
-    });
-  }
+  // scene_embeddings は deleteVideoCascade のトランザクション内で削除済み。
+  // 残りの後始末は互いに独立しているので並行に投げる。
+  const fileKey = info.fileKey;
+  await Promise.all([
+    fileKey
+      ? deleteR2Object(env, fileKey).catch((error) => {
+          reportBestEffortFailure("delete_video_object", error);
+        })
+      : undefined,
+    fileSize !== null
+      ? incrementStorageBytes(env, userId, -fileSize).catch((error) => {
+          reportBestEffortFailure("release_storage_bytes", error);
+        })
+      : undefined,
+  ]);
   await clearOverQuotaIfWithinLimit(env, userId).catch((error) => {
     reportBestEffortFailure("clear_over_quota", error);
   });
@@ -8,7 +8,7 @@ import {
   jwt,
   username,
 } from "better-auth/plugins";
-import { eq, sql } from "drizzle-orm";
+import { eq, inArray, sql } from "drizzle-orm";
 import type { Db } from "../db/pool";
 import * as schema from "../db/schema";
 import type { Bindings } from "../types/bindings";
@@ -61,16 +61,19 @@ async function allocateUniqueUsername(db: Db, preferred: string): Promise<string
         .slice(0, 150);
   if (seed.length < 3) seed = usernameFromEmail(preferred.includes("@") ? preferred : `${seed || "user"}@x`);
 
+  // 候補 50 件を 1 回の IN 検索で照合し、空いている最初の候補を採る。
+  const candidates: string[] = [];
   for (let i = 0; i < 50; i++) {
     const suffix = i === 0 ? "" : `_${i}`;
-    const candidate = `${seed.slice(0, Math.max(1, 150 - suffix.length))}${suffix}`;
-    const rows = await db
-      .select({ id: schema.users.id })
-      .from(schema.users)
-      .where(eq(schema.users.username, candidate))
-      .limit(1);
-    if (rows.length === 0) return candidate;
+    candidates.push(`${seed.slice(0, Math.max(1, 150 - suffix.length))}${suffix}`);
   }
+  const taken = await db
+    .select({ username: schema.users.username })
+    .from(schema.users)
+    .where(inArray(schema.users.username, candidates));
+  const takenSet = new Set(taken.map((r) => r.username));
+  const free = candidates.find((c) => !takenSet.has(c));
+  if (free) return free;
   return `user_${crypto.randomUUID().replace(/-/g, "").slice(0, 12)}`;
 }
 
@@ -311,7 +314,6 @@ export function createAuth(env: Bindings, db: Db) {
       user: {
         create: {
           before: async (user) => {
-            const q = resolveSignupQuotaDefaults(env);
             let username =
               typeof user.username === "string" && user.username.trim()
                 ? user.username.trim()
@@ -336,10 +338,10 @@ export function createAuth(env: Bindings, db: Db) {
                 name,
                 username,
                 displayUsername,
-                maxVideoUploadSizeMb: q.maxVideoUploadSizeMb,
-                aiAnswersLimit: q.aiAnswersLimit,
-                processingLimitMinutes: q.processingLimitMinutes,
-                storageLimitGb: q.storageLimitGb,
+                maxVideoUploadSizeMb: quota.maxVideoUploadSizeMb,
+                aiAnswersLimit: quota.aiAnswersLimit,
+                processingLimitMinutes: quota.processingLimitMinutes,
+                storageLimitGb: quota.storageLimitGb,
                 isOverQuota: false,
                 usedAiAnswers: 0,
                 usedProcessingSeconds: 0,
@@ -84,8 +84,65 @@ async function embedWithOllama(env: Bindings, text: string): Promise<number[]> {
   return json.embedding;
 }
 
-export async function embedQuery(env: Bindings, text: string): Promise<number[]> {
-  const provider = embeddingProvider(env);
+/**
+ * isolate 内の埋め込み LRU + TTL キャッシュ。
+ * 同じ質問の再送や PLOG ラベル再埋め込みで上流呼び出しを省く。成功結果のみ保持する。
+ */
+const EMBEDDING_CACHE_CAPACITY = 256;
+const EMBEDDING_CACHE_TTL_MS = 60 * 60 * 1000;
+
+type CachedEmbedding = { embedding: number[]; expiresAt: number };
+
+const embeddingCache = new Map<string, CachedEmbedding>();
+const embeddingCacheCounters = { hits: 0, misses: 0 };
+
+function embeddingCacheKey(env: Bindings, provider: string, text: string): string {
+  const base =
+    provider === "ollama" ? env.OLLAMA_BASE_URL || DEFAULT_OLLAMA_BASE_URL : openAiBaseUrl(env);
+  const model = env.EMBEDDING_MODEL || (provider === "openai" ? DEFAULT_EMBEDDING_MODEL : "");
+  return [provider, base, model, env.EMBEDDING_VECTOR_SIZE || "", text].join("\u0000");
+}
+
+function readEmbeddingCache(key: string): number[] | undefined {
+  const entry = embeddingCache.get(key);
+  if (!entry) return undefined;
+  if (entry.expiresAt <= Date.now()) {
+    embeddingCache.delete(key);
+    return undefined;
+  }
+  // Map は挿入順を保つので、再挿入で最近使ったものを末尾へ移す。
+  embeddingCache.delete(key);
+  embeddingCache.set(key, entry);
+  return entry.embedding;
+}
+
+function writeEmbeddingCache(key: string, embedding: number[]): void {
+  embeddingCache.delete(key);
+  embeddingCache.set(key, { embedding, expiresAt: Date.now() + EMBEDDING_CACHE_TTL_MS });
+  while (embeddingCache.size > EMBEDDING_CACHE_CAPACITY) {
+    const oldest = embeddingCache.keys().next().value;
+    if (oldest === undefined) break;
+    embeddingCache.delete(oldest);
+  }
+}
+
+/** ヒット率監視用。 */
+export function embeddingCacheStats(): { hits: number; misses: number; size: number } {
+  return { ...embeddingCacheCounters, size: embeddingCache.size };
+}
+
+/** テスト間でキャッシュを隔離する。Worker コードからは呼ばない。 */
+export function clearEmbeddingCacheForTests(): void {
+  embeddingCache.clear();
+  embeddingCacheCounters.hits = 0;
+  embeddingCacheCounters.misses = 0;
+}
+
+async function embedUncached(
+  env: Bindings,
+  provider: string,
+  text: string,
+): Promise<number[]> {
   if (provider === "ollama") return embedWithOllama(env, text);
   if (provider === "openai") return embedWithOpenAi(env, text);
   throw new LlmConfigurationError(
@@ -93,6 +150,20 @@ export async function embedQuery(env: Bindings, text: string): Promise<number[]>
   );
 }
 
+export async function embedQuery(env: Bindings, text: string): Promise<number[]> {
+  const provider = embeddingProvider(env);
+  const key = embeddingCacheKey(env, provider, text);
+  const cached = readEmbeddingCache(key);
+  if (cached) {
+    embeddingCacheCounters.hits++;
+    return cached;
+  }
+  embeddingCacheCounters.misses++;
+  const embedding = await embedUncached(env, provider, text);
+  writeEmbeddingCache(key, embedding);
+  return embedding;
+}
+
 /** pgvector のリテラル表現（PoC #01c: 文字列 + `::vector` キャストで param 渡し可）。 */
 export const toVectorLiteral = (embedding: readonly number[]): string =>
   `[${embedding.join(",")}]`;
@@ -45,6 +45,16 @@ function localeCandidates(locale: string | null | undefined): string[] {
   return out;
 }
 
+/** rootKey 配下で実際に採用されるロケールのキー（見つからなければ default）。 */
+function pickLocaleKey(rootKey: string, locale: string | null | undefined): string {
+  const configRoot = (promptConfig as unknown as PromptRoot)[rootKey] ?? {};
+  for (const candidate of localeCandidates(locale)) {
+    if (candidate === DEFAULT_LOCALE) continue;
+    if (isPlainObject(configRoot[candidate])) return candidate;
+  }
+  return DEFAULT_LOCALE;
+}
+
 /** default に locale の上書きを 1 段だけ deep merge する。 */
 export function resolveLocaleSection(
   rootKey: string,
@@ -56,16 +66,10 @@ export function resolveLocaleSection(
     throw new Error(`Prompt configuration missing 'default' locale for key '${rootKey}'.`);
   }
 
-  let resolved = structuredClone(defaultConfig) as Record<string, unknown>;
-  for (const candidate of localeCandidates(locale)) {
-    if (candidate === DEFAULT_LOCALE) continue;
-    const localeConfig = configRoot[candidate];
-    if (isPlainObject(localeConfig)) {
-      resolved = deepMerge(resolved, localeConfig as Record<string, unknown>);
-      break;
-    }
-  }
-  return resolved;
+  const resolved = structuredClone(defaultConfig) as Record<string, unknown>;
+  const localeKey = pickLocaleKey(rootKey, locale);
+  if (localeKey === DEFAULT_LOCALE) return resolved;
+  return deepMerge(resolved, configRoot[localeKey] as Record<string, unknown>);
 }
 
 /** RAG / plog_study の名前付きプレースホルダを置換する。 */
@@ -82,24 +86,31 @@ function requireText(value: unknown, field: string): string {
   return value;
 }
 
-function referenceLines(
+/** 参照ブロックを中間配列を作らずに lines へ直接追記する。 */
+function appendReferenceLines(
+  lines: string[],
   reference: Record<string, string>,
   references: readonly string[] | undefined,
-): string[] {
-  const lines: string[] = [];
+): void {
   const lead = reference.lead ?? "";
   const footer = reference.footer ?? "";
   const empty = reference.empty ?? "";
 
-  const texts = (references ?? []).map(String).filter((t) => t.trim() !== "");
-  if (texts.length > 0) {
-    if (lead) lines.push(lead);
-    lines.push(...texts);
+  const start = lines.length;
+  if (lead) lines.push(lead);
+  let count = 0;
+  for (const ref of references ?? []) {
+    const text = String(ref);
+    if (text.trim() === "") continue;
+    lines.push(text);
+    count++;
+  }
+  if (count > 0) {
     if (footer) lines.push(footer);
-  } else if (empty) {
-    lines.push(empty);
+    return;
   }
-  return lines;
+  lines.length = start;
+  if (empty) lines.push(empty);
 }
 
 /** locale に対応する PLOG Study 設定を返す。 */
@@ -133,13 +144,18 @@ export function resolveOpeningQuestion(
   return text;
 }
 
-/** locale、参照情報、グループ文脈から system prompt を構築する。 */
-export function buildSystemPrompt(
-  locale?: string | null,
-  references?: readonly string[],
-  groupContext?: string | null,
-): string {
-  const config = resolveLocaleSection("rag", locale) as LocaleSection;
+/** system prompt のうち locale だけで決まる部分。 */
+type RagPromptParts = {
+  header: string;
+  groupContextLabel: string;
+  body: string[];
+  reference: Record<string, string>;
+};
+
+const ragPromptCache = new Map<string, RagPromptParts>();
+
+function buildRagPromptParts(localeKey: string): RagPromptParts {
+  const config = resolveLocaleSection("rag", localeKey) as LocaleSection;
 
   const headerTemplate = requireText(config.header, "header");
   const role = requireText(config.role, "role");
@@ -168,20 +184,38 @@ export function buildSystemPrompt(
     reference_label: referenceLabel,
   });
 
-  const lines: string[] = [header.trim()];
-
-  if (groupContext && groupContext.trim())
-    lines.push("", groupContextLabel, groupContext.trim());
-
-  lines.push("", rulesLabel);
+  const body: string[] = ["", rulesLabel];
   if (rules.length > 0) {
-    rules.forEach((rule, i) => lines.push(`${i + 1}. ${rule}`));
+    rules.forEach((rule, i) => body.push(`${i + 1}. ${rule}`));
   } else {
-    lines.push("1. Follow common-sense safety best practices.");
+    body.push("1. Follow common-sense safety best practices.");
+  }
+  body.push("", formatLabel, formatInstruction.trim(), "", referenceLabel);
+
+  return { header: header.trim(), groupContextLabel, body, reference };
+}
+
+/**
+ * locale、参照情報、グループ文脈から system prompt を構築する。
+ * locale 固定部分（merge・テンプレート展開・ルール番号付け）は採用ロケールごとに 1 度だけ組み立てる。
+ */
+export function buildSystemPrompt(
+  locale?: string | null,
+  references?: readonly string[],
+  groupContext?: string | null,
+): string {
+  const localeKey = pickLocaleKey("rag", locale);
+  let parts = ragPromptCache.get(localeKey);
+  if (!parts) {
+    parts = buildRagPromptParts(localeKey);
+    ragPromptCache.set(localeKey, parts);
   }
 
-  lines.push("", formatLabel, formatInstruction.trim(), "", referenceLabel);
-  lines.push(...referenceLines(reference, references));
+  const lines: string[] = [parts.header];
+  if (groupContext && groupContext.trim())
+    lines.push("", parts.groupContextLabel, groupContext.trim());
+  lines.push(...parts.body);
+  appendReferenceLines(lines, parts.reference, references);
 
   return lines.join("\n");
 }
@@ -61,23 +61,26 @@ export async function prepareRagContext(
       })
     : [];
 
-  const references = docs.map(
-    (d, i) => `[${i + 1}] ${d.videoTitle} ${d.startTime} - ${d.endTime}\n${d.content}`,
-  );
+  // 参照文・引用・評価用コンテキストを検索結果の 1 パスで組み立てる。
+  const references: string[] = [];
+  const citations: RagCitation[] = [];
+  const retrievedContexts: string[] = [];
+  docs.forEach((d, i) => {
+    references.push(`[${i + 1}] ${d.videoTitle} ${d.startTime} - ${d.endTime}\n${d.content}`);
+    citations.push({
+      video_id: d.videoId,
+      title: d.videoTitle,
+      start_time: d.startTime,
+      end_time: d.endTime,
+    });
+    if (d.content !== "") retrievedContexts.push(d.content);
+  });
 
   return {
     queryText,
     systemPrompt: buildSystemPrompt(params.locale, references, params.groupContext),
-    citations:
-      docs.length === 0
-        ? null
-        : docs.map((d) => ({
-            video_id: d.videoId,
-            title: d.videoTitle,
-            start_time: d.startTime,
-            end_time: d.endTime,
-          })),
-    retrievedContexts: docs.map((d) => d.content).filter((t) => t !== ""),
+    citations: citations.length === 0 ? null : citations,
+    retrievedContexts,
   };
 }
 
@@ -15,6 +15,9 @@ export const ALLOWED_VIDEO_EXTENSIONS = [
   ".webm",
 ] as const;
 
+// 判定用はハッシュ引き。列挙順が必要なメッセージ生成は上の配列を使う。
+const ALLOWED_VIDEO_EXTENSION_SET: ReadonlySet<string> = new Set(ALLOWED_VIDEO_EXTENSIONS);
+
 export const ALLOWED_VIDEO_MIMETYPES = new Set([
   "video/mp4",
   "video/quicktime",
@@ -40,12 +43,18 @@ export function buildPendingUploadFileKey(
   return `videos/${userId}/video_${nowMs}_${reservedBytes}${ext}`;
 }
 
+/** `/` と `\` の両方を区切りとみなした末尾要素。split で配列を作らずに切り出す。 */
+function basename(path: string): string {
+  const sep = Math.max(path.lastIndexOf("/"), path.lastIndexOf("\\"));
+  return sep < 0 ? path : path.slice(sep + 1);
+}
+
 /**
  * file key から予約バイト数を読む（新形式のみ）。
  * 旧形式 `video_{ms}{ext}` は null。
  */
 export function parseReservedBytesFromFileKey(fileKey: string): number | null {
-  const base = fileKey.split(/[\\/]/).pop() ?? fileKey;
+  const base = basename(fileKey);
   // video_{timestamp}_{bytes}.ext
   const m = /^video_\d+_(\d+)\.[^.]+$/i.exec(base);
   if (!m) return null;
@@ -58,13 +67,12 @@ export function parseReservedBytesFromFileKey(fileKey: string): number | null {
  * 先頭ドットのみ（隠しファイル）は拡張子扱いしない。パス区切りは basename に落とす。
  */
 export function fileExtension(filename: string): string {
-  const base = filename.split(/[\\/]/).pop() ?? filename;
+  const base = basename(filename);
   // 先頭の連続ドットを除いた位置以降で最後のドットを探す。
   let start = 0;
   while (start < base.length && base[start] === ".") start++;
   const dot = base.lastIndexOf(".");
-  if (dot <= start - 1 || dot < start) return "";
-  if (dot < 0) return "";
+  if (dot < start) return "";
   return base.slice(dot).toLowerCase();
 }
 
@@ -77,7 +85,7 @@ export function invalidContentTypeMessage(contentType: string): string {
 }
 
 export function isAllowedExtension(ext: string): boolean {
-  return (ALLOWED_VIDEO_EXTENSIONS as readonly string[]).includes(ext);
+  return ALLOWED_VIDEO_EXTENSION_SET.has(ext);
 }
 
 export function isAllowedContentType(contentType: string): boolean {
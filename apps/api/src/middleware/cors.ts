@@ -1,3 +1,4 @@
+import type { MiddlewareHandler } from "hono";
 import { cors } from "hono/cors";
 import { createMiddleware } from "hono/factory";
 import type { AppEnv } from "../types/bindings";
@@ -21,42 +22,34 @@ const PROTOCOL_EXPOSE_HEADERS = [
 
 const PROTOCOL_ALLOW_METHODS = ["GET", "POST", "DELETE", "OPTIONS"];
 
+/** `/api/mcp`（完全一致または配下）と各プロトコル prefix を 1 本の正規表現で判定する。 */
+const MCP_PROTOCOL_PATH_RE =
+  /^(?:\/api\/mcp(?:\/|$)|\/\.well-known\/|\/api\/auth\/oauth2\/|\/api\/auth\/\.well-known\/)/;
+
 /**
  * MCP / OAuth の公開プロトコル経路か。
  * これらは SPA Cookie ではなく外部 MCP クライアント向けなので、
  * `Access-Control-Allow-Origin: *`（credentials なし）で応答する。
  */
 export function isMcpProtocolPath(pathname: string): boolean {
-  return (
-    pathname === "/api/mcp" ||
-    pathname.startsWith("/api/mcp/") ||
-    pathname.startsWith("/.well-known/") ||
-    pathname.startsWith("/api/auth/oauth2/") ||
-    pathname === "/api/auth/oauth2/register" ||
-    pathname.startsWith("/api/auth/.well-known/")
-  );
+  return MCP_PROTOCOL_PATH_RE.test(pathname);
 }
 
-/**
- * CORS。
- * - MCP / OAuth プロトコル: `*` + credentials なし（Claude Code / claude.ai コネクタ向け）
- * - それ以外: env の許可オリジンに限定し credentials(Cookie) を許可
- */
-export const corsMiddleware = createMiddleware<AppEnv>(async (c, next) => {
-  const pathname = new URL(c.req.url).pathname;
+// プロトコル経路の設定は固定なので、ハンドラはモジュール読み込み時に 1 度だけ作る。
+const protocolCors = cors({
+  origin: "*",
+  allowHeaders: PROTOCOL_ALLOW_HEADERS,
+  allowMethods: PROTOCOL_ALLOW_METHODS,
+  exposeHeaders: PROTOCOL_EXPOSE_HEADERS,
+  maxAge: 86400,
+});
 
-  if (isMcpProtocolPath(pathname)) {
-    const handler = cors({
-      origin: "*",
-      allowHeaders: PROTOCOL_ALLOW_HEADERS,
-      allowMethods: PROTOCOL_ALLOW_METHODS,
-      exposeHeaders: PROTOCOL_EXPOSE_HEADERS,
-      maxAge: 86400,
-    });
-    return handler(c, next);
-  }
+// CORS_ALLOW_ORIGIN はデプロイ中は不変。文字列が変わったときだけ作り直す。
+let appCors: { allowOrigin: string; handler: MiddlewareHandler } | null = null;
 
-  const allowed = (c.env.CORS_ALLOW_ORIGIN ?? "")
+function appCorsFor(allowOrigin: string): MiddlewareHandler {
+  if (appCors?.allowOrigin === allowOrigin) return appCors.handler;
+  const allowed = allowOrigin
     .split(",")
     .map((s) => s.trim())
     .filter(Boolean);
@@ -69,5 +62,16 @@ export const corsMiddleware = createMiddleware<AppEnv>(async (c, next) => {
     allowMethods: ["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"],
     exposeHeaders: ["X-Request-Id"],
   });
-  return handler(c, next);
+  appCors = { allowOrigin, handler };
+  return handler;
+}
+
+/**
+ * CORS。
+ * - MCP / OAuth プロトコル: `*` + credentials なし（Claude Code / claude.ai コネクタ向け）
+ * - それ以外: env の許可オリジンに限定し credentials(Cookie) を許可
+ */
+export const corsMiddleware = createMiddleware<AppEnv>(async (c, next) => {
+  if (isMcpProtocolPath(c.req.path)) return protocolCors(c, next);
+  return appCorsFor(c.env.CORS_ALLOW_ORIGIN ?? "")(c, next);
 });
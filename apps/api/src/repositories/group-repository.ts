@@ -40,7 +40,8 @@ export type GroupDetail = {
   videos: (VideoListItem & { order: number })[];
 };
 
-const groupVideoCount = sql<number>`(SELECT count(DISTINCT m.video_id)::int FROM video_group_members m WHERE m.group_id = ${videoGroups.id})`.as(
+// (group_id, video_id) は一意制約付きなので DISTINCT 不要。一意インデックスだけで数えられる。
+const groupVideoCount = sql<number>`(SELECT count(*)::int FROM video_group_members m WHERE m.group_id = ${videoGroups.id})`.as(
   "video_count",
 );
 // Outer table must be qualified — ${videos.id} becomes bare "id" (ambiguous vs t.id).
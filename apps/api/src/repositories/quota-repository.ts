@@ -44,31 +44,21 @@ export async function checkAiAnswersLimit(
  * maybe_reset_monthly_usage → increment_ai_answers の順で、月替わり（UTC の年/月比較）なら
  * used_processing_seconds / used_ai_answers を 0 にして usage_period_start を now に更新する。
  * 初回（usage_period_start IS NULL）も同じくリセット扱い。
+ * リセットと加算は CASE で 1 本の UPDATE にまとめる（SET の右辺はすべて更新前の行を見る）。
  */
 export async function recordAiAnswerUsage(env: Bindings, userId: number): Promise<void> {
+  const newPeriod = sql`(
+    ${users.usagePeriodStart} IS NULL
+    OR date_trunc('month', ${users.usagePeriodStart} AT TIME ZONE 'UTC')
+       <> date_trunc('month', now() AT TIME ZONE 'UTC')
+  )`;
   return withDb(env, async (db) => {
     await db
       .update(users)
       .set({
-        usedProcessingSeconds: 0,
-        usedAiAnswers: 0,
-        usagePeriodStart: sql`now()`,
-      })
-      .where(
-        and(
-          eq(users.id, userId),
-          sql`(
-            ${users.usagePeriodStart} IS NULL
-            OR date_trunc('month', ${users.usagePeriodStart} AT TIME ZONE 'UTC')
-               <> date_trunc('month', now() AT TIME ZONE 'UTC')
-          )`,
-        ),
-      );
-
-    await db
-      .update(users)
-      .set({
-        usedAiAnswers: sql`${users.usedAiAnswers} + 1`,
+        usedProcessingSeconds: sql`CASE WHEN ${newPeriod} THEN 0 ELSE ${users.usedProcessingSeconds} END`,
+        usedAiAnswers: sql`CASE WHEN ${newPeriod} THEN 1 ELSE ${users.usedAiAnswers} + 1 END`,
+        usagePeriodStart: sql`CASE WHEN ${newPeriod} THEN now() ELSE ${users.usagePeriodStart} END`,
       })
       .where(eq(users.id, userId));
   });
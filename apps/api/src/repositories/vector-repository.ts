@@ -68,20 +68,6 @@ export async function searchScenes(
   });
 }
 
-export async function deleteVideoVectors(
-  env: Bindings,
-  videoId: number,
-): Promise<number> {
-  resolveVectorTable(env);
-  return withDb(env, async (db) => {
-    const deleted = await db
-      .delete(sceneEmbeddings)
-      .where(eq(sceneEmbeddings.videoId, videoId))
-      .returning({ id: sceneEmbeddings.langchainId });
-    return deleted.length;
-  });
-}
-
 export async function syncVectorTitle(
   env: Bindings,
   videoId: number,
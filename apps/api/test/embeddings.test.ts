@@ -1,5 +1,5 @@
 import { describe, expect, it, vi, afterEach } from "vitest";
-import { embedQuery, toVectorLiteral } from "../src/lib/embeddings";
+import { embedQuery, embeddingCacheStats, toVectorLiteral } from "../src/lib/embeddings";
 import type { Bindings } from "../src/types/bindings";
 
 const baseEnv = {
@@ -42,4 +42,26 @@ describe("embedQuery", () => {
       prompt: "hello",
     });
   });
+
+  it("serves repeated queries from the isolate cache", async () => {
+    const fetchMock = vi.fn(async () =>
+      new Response(JSON.stringify({ embedding: [0.4, 0.6] }), {
+        status: 200,
+        headers: { "content-type": "application/json" },
+      }),
+    );
+    vi.stubGlobal("fetch", fetchMock);
+    const env = {
+      ...baseEnv,
+      EMBEDDING_PROVIDER: "ollama",
+      EMBEDDING_MODEL: "qwen3-embedding:0.6b",
+    };
+
+    expect(await embedQuery(env, "same question")).toEqual([0.4, 0.6]);
+    expect(await embedQuery(env, "same question")).toEqual([0.4, 0.6]);
+    await embedQuery({ ...env, EMBEDDING_MODEL: "other-model" }, "same question");
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(embeddingCacheStats()).toMatchObject({ hits: 1, misses: 2, size: 2 });
+  });
 });
@@ -1,10 +1,12 @@
 import { beforeEach } from "vitest";
+import { clearEmbeddingCacheForTests } from "../src/lib/embeddings";
 import {
   createMemoryRateLimitBackend,
   setRateLimitBackendForTests,
 } from "../src/lib/rate-limit";
 
-/** メモリ・レート制限カウンタをテスト間で隔離する。 */
+/** メモリ・レート制限カウンタと埋め込みキャッシュをテスト間で隔離する。 */
 beforeEach(() => {
   setRateLimitBackendForTests(createMemoryRateLimitBackend());
+  clearEmbeddingCacheForTests();
 });
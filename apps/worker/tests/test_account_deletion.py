@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from worker_python.tasks import account_deletion
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConn:
+    def __init__(self, rows) -> None:
+        self.rows = rows
+        self.statements: list[tuple[str, tuple]] = []
+
+    def execute(self, sql, params=()):
+        self.statements.append((" ".join(sql.split()), params))
+        return FakeResult(self.rows if sql.lstrip().startswith("SELECT id, file") else [])
+
+
+def test_delete_all_videos_for_user_batches_table_and_storage_deletes(monkeypatch) -> None:
+    conn = FakeConn(
+        [{"id": 1, "file": "videos/7/a.mp4"}, {"id": 2, "file": None}, {"id": 3, "file": "b.mp4"}]
+    )
+    deleted_files: list[list[str]] = []
+    monkeypatch.setattr(account_deletion, "delete_objects", deleted_files.append)
+
+    account_deletion._delete_all_videos_for_user(conn, 7)
+
+    assert deleted_files == [["videos/7/a.mp4", "b.mp4"]]
+    video_deletes = [s for s in conn.statements if s[0].startswith("DELETE FROM videos")]
+    assert video_deletes == [("DELETE FROM videos WHERE id = ANY(%s) AND user_id = %s", ([1, 2, 3], 7))]
+    # One statement per dependent table regardless of how many videos are removed.
+    assert sum(1 for sql, _ in conn.statements if sql.startswith("DELETE")) == 9
+
+
+def test_delete_all_videos_for_user_skips_work_without_videos(monkeypatch) -> None:
+    conn = FakeConn([])
+    monkeypatch.setattr(
+        account_deletion,
+        "delete_objects",
+        lambda keys: (_ for _ in ()).throw(AssertionError("unexpected storage delete")),
+    )
+
+    account_deletion._delete_all_videos_for_user(conn, 7)
+
+    assert len(conn.statements) == 1
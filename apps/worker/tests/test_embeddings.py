@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+import json
+import urllib.error
+
+import pytest
+
+from worker_python.pipeline import embeddings
+
+
+class FakeResponse(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _ollama_env(monkeypatch) -> None:
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "ollama")
+    monkeypatch.setenv("EMBEDDING_MODEL", "qwen3-embedding:0.6b")
+    monkeypatch.setenv("OLLAMA_BASE_URL", "http://ollama.test")
+    monkeypatch.setattr(embeddings, "_LEGACY_OLLAMA_BASES", set())
+
+
+def test_ollama_embeds_whole_batch_in_one_request(monkeypatch) -> None:
+    _ollama_env(monkeypatch)
+    sent: list[tuple[str, dict]] = []
+
+    def fake_urlopen(req, timeout):
+        sent.append((req.full_url, json.loads(req.data)))
+        return FakeResponse(json.dumps({"embeddings": [[1, 0], [0, 1]]}).encode())
+
+    monkeypatch.setattr(embeddings.urllib.request, "urlopen", fake_urlopen)
+
+    assert embeddings.embed_texts(["a", "b"]) == [[1.0, 0.0], [0.0, 1.0]]
+    assert sent == [
+        (
+            "http://ollama.test/api/embed",
+            {"model": "qwen3-embedding:0.6b", "input": ["a", "b"]},
+        )
+    ]
+
+
+def test_ollama_falls_back_to_legacy_endpoint_on_404(monkeypatch) -> None:
+    _ollama_env(monkeypatch)
+    urls: list[str] = []
+
+    def fake_urlopen(req, timeout):
+        urls.append(req.full_url)
+        if req.full_url.endswith("/api/embed"):
+            raise urllib.error.HTTPError(
+                req.full_url, 404, "not found", {}, io.BytesIO(b"404 page not found")
+            )
+        prompt = json.loads(req.data)["prompt"]
+        return FakeResponse(json.dumps({"embedding": [float(len(prompt))]}).encode())
+
+    monkeypatch.setattr(embeddings.urllib.request, "urlopen", fake_urlopen)
+
+    assert embeddings.embed_texts(["a", "bb"]) == [[1.0], [2.0]]
+    assert embeddings.embed_texts(["ccc"]) == [[3.0]]
+    # The failed probe is remembered; the second batch goes straight to the legacy route.
+    assert urls == [
+        "http://ollama.test/api/embed",
+        "http://ollama.test/api/embeddings",
+        "http://ollama.test/api/embeddings",
+        "http://ollama.test/api/embeddings",
+    ]
+
+
+def test_ollama_unknown_model_404_does_not_fall_back(monkeypatch) -> None:
+    _ollama_env(monkeypatch)
+    urls: list[str] = []
+
+    def fake_urlopen(req, timeout):
+        urls.append(req.full_url)
+        body = b'{"error":"model \\"qwen3-embedding:0.6b\\" not found, try pulling it first"}'
+        raise urllib.error.HTTPError(req.full_url, 404, "not found", {}, io.BytesIO(body))
+
+    monkeypatch.setattr(embeddings.urllib.request, "urlopen", fake_urlopen)
+
+    with pytest.raises(RuntimeError, match="not found, try pulling"):
+        embeddings.embed_texts(["a"])
+    assert urls == ["http://ollama.test/api/embed"]
+    assert embeddings._LEGACY_OLLAMA_BASES == set()
+
+
+def test_embed_in_batches_preserves_input_order(monkeypatch) -> None:
+    seen: list[list[str]] = []
+
+    def fake_embed(texts: list[str]) -> list[list[float]]:
+        seen.append(texts)
+        return [[float(t)] for t in texts]
+
+    monkeypatch.setattr(embeddings, "embed_texts", fake_embed)
+
+    texts = [str(i) for i in range(10)]
+    assert embeddings.embed_in_batches(texts, 3) == [[float(i)] for i in range(10)]
+    assert sorted(len(batch) for batch in seen) == [1, 3, 3, 3]
@@ -0,0 +1,23 @@
+import sys
+import types
+
+from worker_python.pipeline import openai_clients
+
+
+def test_get_openai_client_reuses_client_per_key_and_base_url(monkeypatch) -> None:
+    created = []
+
+    class FakeOpenAI:
+        def __init__(self, api_key, base_url=None):
+            created.append((api_key, base_url))
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    openai_clients.get_openai_client.cache_clear()
+
+    first = openai_clients.get_openai_client("sk-a")
+    assert openai_clients.get_openai_client("sk-a") is first
+    assert openai_clients.get_openai_client("sk-b") is not first
+    openai_clients.get_openai_client("sk-a", "http://local:8080")
+
+    assert created == [("sk-a", None), ("sk-b", None), ("sk-a", "http://local:8080")]
+    openai_clients.get_openai_client.cache_clear()
@@ -39,8 +39,10 @@ def test_find_otsu_threshold_two_clusters() -> None:
 
 def test_process_merges_under_token_budget() -> None:
     mock_embedder = MagicMock()
-    mock_embedder.count_tokens.side_effect = lambda t: max(1, len(t.split()))
-    mock_embedder.encoding.encode.side_effect = lambda t: list(range(len(t.split()) or 1))
+    mock_embedder.count_tokens_batch.side_effect = lambda texts: [
+        max(1, len(t.split())) for t in texts
+    ]
+    mock_embedder.encoding.encode_ordinary.side_effect = lambda t: list(range(len(t.split()) or 1))
     mock_embedder.encoding.decode.side_effect = lambda ids: "x" * len(ids)
     # Two similar cues → one scene when total tokens <= max_tokens
     mock_embedder.get_embeddings.return_value = np.array(
@@ -61,8 +63,8 @@ def test_process_merges_under_token_budget() -> None:
 def test_process_splits_dissimilar_when_over_budget() -> None:
     mock_embedder = MagicMock()
     # Each cue is 300 tokens → together 600 > 512, must split
-    mock_embedder.count_tokens.return_value = 300
-    mock_embedder.encoding.encode.side_effect = lambda t: list(range(300))
+    mock_embedder.count_tokens_batch.side_effect = lambda texts: [300] * len(texts)
+    mock_embedder.encoding.encode_ordinary.side_effect = lambda t: list(range(300))
     mock_embedder.encoding.decode.side_effect = lambda ids: "tok"
     mock_embedder.get_embeddings.return_value = np.array(
         [[1.0, 0.0], [0.0, 1.0]], dtype=np.float64
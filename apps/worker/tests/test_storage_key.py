@@ -11,3 +11,27 @@ def test_object_storage_key_idempotent() -> None:
 
 def test_object_storage_key_strips_leading_slash() -> None:
     assert object_storage_key("/videos/1/a.mp4") == "media/videos/1/a.mp4"
+
+
+def test_delete_objects_batches_keys_per_request(monkeypatch) -> None:
+    from worker_python.pipeline import storage
+
+    calls: list[dict] = []
+
+    class FakeClient:
+        def delete_objects(self, **kwargs):
+            calls.append(kwargs)
+            return {}
+
+    monkeypatch.setenv("USE_S3_STORAGE", "true")
+    monkeypatch.setenv("R2_BUCKET_NAME", "bucket")
+    monkeypatch.setattr(storage, "_s3_client", FakeClient)
+    monkeypatch.setattr(storage, "DELETE_OBJECTS_BATCH_SIZE", 2)
+
+    storage.delete_objects(["a.mp4", "", "b.mp4", "media/c.mp4"])
+
+    assert [c["Bucket"] for c in calls] == ["bucket", "bucket"]
+    assert [[o["Key"] for o in c["Delete"]["Objects"]] for c in calls] == [
+        ["media/a.mp4", "media/b.mp4"],
+        ["media/c.mp4"],
+    ]
@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+from worker_python.pipeline import tokens
+
+
+class CharEncoding:
+    """One token per character; enough to exercise truncation boundaries."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return list(text)
+
+    def decode(self, ids: list[str]) -> str:
+        return "".join(ids)
+
+
+class ChunkEncoding(CharEncoding):
+    """One token per ``width`` characters; sparser than the clip ratio assumes."""
+
+    def __init__(self, width: int = 20) -> None:
+        super().__init__()
+        self.width = width
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return [text[i : i + self.width] for i in range(0, len(text), self.width)]
+
+
+def test_get_encoding_is_cached_per_provider_and_model(monkeypatch) -> None:
+    calls: list[str] = []
+    fake_tiktoken = MagicMock()
+    fake_tiktoken.get_encoding.side_effect = lambda name: calls.append(name) or object()
+    monkeypatch.setattr(tokens, "tiktoken", fake_tiktoken)
+    monkeypatch.setenv("EMBEDDING_PROVIDER", "ollama")
+    monkeypatch.setenv("EMBEDDING_MODEL", "qwen3-embedding:0.6b")
+    tokens.get_encoding.cache_clear()
+    try:
+        first = tokens.resolve_encoding()
+        second = tokens.resolve_encoding()
+    finally:
+        tokens.get_encoding.cache_clear()
+
+    assert first is second
+    assert calls == ["cl100k_base"]
+
+
+def test_truncate_skips_encoding_when_bytes_fit() -> None:
+    enc = CharEncoding()
+    assert tokens.truncate_text_to_token_limit("short", 10, enc) == "short"
+    assert enc.encoded == []
+
+
+def test_truncate_cuts_to_token_limit() -> None:
+    enc = CharEncoding()
+    assert tokens.truncate_text_to_token_limit("あいうえお", 3, enc) == "あいう"
+
+
+def test_truncate_clips_huge_input_before_encoding() -> None:
+    enc = CharEncoding()
+    out = tokens.truncate_text_to_token_limit("x" * 100_000, 4, enc)
+    assert out == "xxxx"
+    assert len(enc.encoded[0]) == 4 * tokens._CLIP_CHARS_PER_TOKEN
+
+
+def _max_window(max_tokens: int) -> int:
+    return max_tokens * tokens._CLIP_CHARS_PER_TOKEN * tokens._MAX_CLIP_WIDENING
+
+
+def test_truncate_keeps_sparse_text_that_fits_after_clip() -> None:
+    enc = ChunkEncoding()
+    text = " " * 60
+    assert tokens.truncate_text_to_token_limit(text, 4, enc) == text
+    assert max(len(t) for t in enc.encoded) <= _max_window(4)
+
+
+def test_truncate_cuts_sparse_text_at_token_limit() -> None:
+    enc = ChunkEncoding()
+    out = tokens.truncate_text_to_token_limit("." * 200, 4, enc)
+    assert out == "." * 80
+
+
+def test_truncate_caps_tokenizer_window_on_very_sparse_text() -> None:
+    enc = ChunkEncoding(width=1000)
+    text = " " * 100_000
+    out = tokens.truncate_text_to_token_limit(text, 4, enc)
+    assert out == text[: _max_window(4)]
+    assert max(len(t) for t in enc.encoded) <= _max_window(4)
@@ -24,6 +24,14 @@ def test_decrypts_api_compatible_aes_gcm_envelope(monkeypatch) -> None:
     assert UserSecretEnvelope().decrypt(envelope) == "search-api-key"
     assert UserSecretEnvelope().decrypt(envelope.encode()) == "search-api-key"
     assert UserSecretEnvelope().decrypt(memoryview(envelope.encode())) == "search-api-key"
+    assert UserSecretEnvelope().decrypt_bytes(envelope.encode()) == b"search-api-key"
+
+
+def test_decrypt_rejects_non_ascii_envelope_with_value_error(monkeypatch) -> None:
+    monkeypatch.setenv("USER_SECRET_ENCRYPTION_KEY", _base64url(bytes(range(32))))
+
+    with pytest.raises(ValueError, match="valid base64url"):
+        UserSecretEnvelope().decrypt("v1.é.AA")
 
 
 def test_requires_base64url_encoded_32_byte_key(monkeypatch) -> None:
@@ -65,3 +73,18 @@ def test_try_decrypt_returns_none_without_key(monkeypatch) -> None:
     monkeypatch.delenv("USER_SECRET_ENCRYPTION_KEY", raising=False)
 
     assert try_decrypt("v1.AA.AA") is None
+
+
+def test_try_decrypt_reuses_cipher_until_key_changes(monkeypatch) -> None:
+    from worker_python.pipeline import user_secret_envelope
+
+    user_secret_envelope._envelope_for_key.cache_clear()
+    first_key, second_key = bytes(range(32)), bytes(range(1, 33))
+
+    monkeypatch.setenv("USER_SECRET_ENCRYPTION_KEY", _base64url(first_key))
+    assert try_decrypt(_envelope(first_key, "a")) == "a"
+    assert try_decrypt(_envelope(first_key, "b")) == "b"
+    assert user_secret_envelope._envelope_for_key.cache_info().misses == 1
+
+    monkeypatch.setenv("USER_SECRET_ENCRYPTION_KEY", _base64url(second_key))
+    assert try_decrypt(_envelope(second_key, "c")) == "c"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 
-from worker_python.pipeline import vector_index
+from worker_python.pipeline import embeddings, vector_index
 from worker_python.video_sql import VideoRow
 
 
@@ -72,7 +72,7 @@ def test_index_video_transcript_uses_pgvectorstore_with_standard_metadata(
     store = FakeStore()
     use_fake_store(monkeypatch, store)
     monkeypatch.setattr(
-        vector_index,
+        embeddings,
         "embed_texts",
         lambda texts: [[float(index), 0.5] for index, _ in enumerate(texts)],
     )
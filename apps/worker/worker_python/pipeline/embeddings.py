@@ -6,30 +6,53 @@ import json
 import logging
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 from worker_python.env import env_str
+from worker_python.pipeline.tokens import get_encoding, truncate_text_to_token_limit
 
 logger = logging.getLogger(__name__)
 
+# text-embedding-3-* rejects inputs over 8191 tokens.
+OPENAI_EMBEDDING_MAX_TOKENS = 8191
+# Provider calls are I/O-bound; overlap a few batches per task.
+EMBED_CONCURRENCY = 4
+# Ollama base URLs known to lack /api/embed, so later batches skip the probe.
+_LEGACY_OLLAMA_BASES: set[str] = set()
+
 
 def embed_texts(texts: list[str]) -> list[list[float]]:
     if not texts:
         return []
     provider = env_str("EMBEDDING_PROVIDER", "openai").lower()
     if provider == "ollama":
-        return [_embed_ollama(t) for t in texts]
+        return _embed_ollama_batch(texts)
     if provider == "openai":
         return _embed_openai_batch(texts)
     raise RuntimeError(f"Unsupported EMBEDDING_PROVIDER={provider!r}")
 
 
+def embed_in_batches(texts: list[str], batch_size: int) -> list[list[float]]:
+    """Embed fixed-size batches concurrently; output order matches input."""
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    if len(batches) <= 1:
+        return embed_texts(texts)
+    with ThreadPoolExecutor(max_workers=min(EMBED_CONCURRENCY, len(batches))) as pool:
+        return [vec for vectors in pool.map(embed_texts, batches) for vec in vectors]
+
+
 def _embed_openai_batch(texts: list[str]) -> list[list[float]]:
     api_key = env_str("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is required for OpenAI embeddings")
     model = env_str("EMBEDDING_MODEL", "text-embedding-3-small")
     base = env_str("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
-    body: dict = {"model": model, "input": texts, "encoding_format": "float"}
+    encoding = get_encoding("openai", model)
+    inputs = [
+        truncate_text_to_token_limit(t, OPENAI_EMBEDDING_MAX_TOKENS, encoding)
+        for t in texts
+    ]
+    body: dict = {"model": model, "input": inputs, "encoding_format": "float"}
     dims_raw = env_str("EMBEDDING_VECTOR_SIZE")
     if dims_raw.isdigit() and int(dims_raw) > 0:
         body["dimensions"] = int(dims_raw)
@@ -64,11 +87,60 @@ def _embed_openai_batch(texts: list[str]) -> list[list[float]]:
     return out
 
 
-def _embed_ollama(text: str) -> list[float]:
+def _ollama_model_and_base() -> tuple[str, str]:
     model = env_str("EMBEDDING_MODEL")
     if not model:
         raise RuntimeError("EMBEDDING_MODEL is required when EMBEDDING_PROVIDER=ollama")
-    base = env_str("OLLAMA_BASE_URL", "http://127.0.0.1:11434").rstrip("/")
+    return model, env_str("OLLAMA_BASE_URL", "http://127.0.0.1:11434").rstrip("/")
+
+
+def _embed_ollama_batch(texts: list[str]) -> list[list[float]]:
+    """One `/api/embed` request per batch; falls back to per-text calls on old Ollama."""
+    model, base = _ollama_model_and_base()
+    if base in _LEGACY_OLLAMA_BASES:
+        return [_embed_ollama(t) for t in texts]
+    req = urllib.request.Request(
+        f"{base}/api/embed",
+        data=json.dumps({"model": model, "input": texts}).encode("utf-8"),
+        headers={"content-type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=120) as resp:
+            payload = json.loads(resp.read().decode("utf-8"))
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="replace")[:500]
+        # A missing route is a plain-text 404; a JSON error (e.g. unknown model)
+        # means /api/embed exists and the request itself was rejected.
+        if exc.code != 404 or _is_ollama_json_error(detail):
+            raise RuntimeError(f"Ollama embeddings failed ({exc.code}): {detail}") from exc
+        logger.info("Ollama at %s has no /api/embed; embedding one text per call", base)
+        _LEGACY_OLLAMA_BASES.add(base)
+        return [_embed_ollama(t) for t in texts]
+    except urllib.error.URLError as exc:
+        raise RuntimeError(f"Ollama embeddings unreachable at {base}: {exc}") from exc
+
+    vectors = payload.get("embeddings")
+    if not isinstance(vectors, list) or len(vectors) != len(texts):
+        raise RuntimeError("Ollama embeddings response missing vectors")
+    out: list[list[float]] = []
+    for emb in vectors:
+        if not isinstance(emb, list) or not emb:
+            raise RuntimeError("Ollama embeddings response missing vectors")
+        out.append([float(x) for x in emb])
+    return out
+
+
+def _is_ollama_json_error(body: str) -> bool:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and "error" in payload
+
+
+def _embed_ollama(text: str) -> list[float]:
+    model, base = _ollama_model_and_base()
     req = urllib.request.Request(
         f"{base}/api/embeddings",
         data=json.dumps({"model": model, "prompt": text}).encode("utf-8"),
@@ -0,0 +1,17 @@
+"""Process-wide OpenAI SDK clients shared across warm Lambda invocations."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+@functools.lru_cache(maxsize=8)
+def get_openai_client(api_key: str, base_url: str | None = None) -> OpenAI:
+    """Reuse one client (and its httpx connection pool) per key and endpoint."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url=base_url)
@@ -10,6 +10,7 @@ import psycopg
 
 from worker_python.env import env_str, heavy_pipeline_enabled
 from worker_python.pipeline.embeddings import embed_texts
+from worker_python.pipeline.openai_clients import get_openai_client
 from worker_python.pipeline.srt import parse_srt_scenes
 
 logger = logging.getLogger(__name__)
@@ -110,8 +111,6 @@ def run_plog_pipeline(conn: psycopg.Connection[Any], video_id: int, transcript:
 
 
 def _extract_concepts(transcript: str, scenes: list) -> list[dict[str, Any]]:
-    from openai import OpenAI
-
     api_key = env_str("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is required for PLOG build")
@@ -122,7 +121,7 @@ def _extract_concepts(transcript: str, scenes: list) -> list[dict[str, Any]]:
         scene_summaries.append(
             f"[{sc.start_time}-{sc.end_time}] {sc.text[:200]}"
         )
-    client = OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
     model = env_str("LLM_MODEL", "gpt-4o-mini")
     prompt = (
         "Extract 3-12 learning concepts from this lecture transcript for a guided study graph.\n"
@@ -5,10 +5,9 @@ from __future__ import annotations
 import logging
 
 import numpy as np
-import tiktoken
 
-from worker_python.env import env_str
-from worker_python.pipeline.embeddings import embed_texts
+from worker_python.pipeline.embeddings import embed_in_batches
+from worker_python.pipeline.tokens import resolve_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -16,32 +15,19 @@ logger = logging.getLogger(__name__)
 class SceneEmbedder:
     def __init__(self, batch_size: int = 16):
         self.batch_size = batch_size
-        self.encoding = _resolve_encoding()
+        self.encoding = resolve_encoding()
 
-    def count_tokens(self, text: str) -> int:
-        return len(self.encoding.encode(text))
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        # encode_ordinary_batch maps over a per-call ThreadPoolExecutor; the Rust
+        # encoder releases the GIL, so the cues are encoded in parallel.
+        return [len(ids) for ids in self.encoding.encode_ordinary_batch(texts)]
 
     def get_embeddings(self, texts: list[str]) -> np.ndarray:
         if not texts:
             return np.zeros((0, 0), dtype=np.float64)
-        all_embeddings: list[np.ndarray] = []
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            vectors = embed_texts(batch)
-            all_embeddings.append(np.asarray(vectors, dtype=np.float64))
-        return np.vstack(all_embeddings)
+        vectors = embed_in_batches(texts, self.batch_size)
+        return np.asarray(vectors, dtype=np.float64)
 
 
 def create_embedder(*, batch_size: int = 16) -> SceneEmbedder:
     return SceneEmbedder(batch_size=batch_size)
-
-
-def _resolve_encoding() -> tiktoken.Encoding:
-    provider = env_str("EMBEDDING_PROVIDER", "openai").lower()
-    model = env_str("EMBEDDING_MODEL", "text-embedding-3-small")
-    if provider == "openai":
-        try:
-            return tiktoken.encoding_for_model(model)
-        except KeyError:
-            logger.info("tiktoken has no encoding for %s; using cl100k_base", model)
-    return tiktoken.get_encoding("cl100k_base")
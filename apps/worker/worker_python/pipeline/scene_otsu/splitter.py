@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from itertools import accumulate
+
 import numpy as np
 
 from .embedders import SceneEmbedder, create_embedder
@@ -53,7 +55,7 @@ class SceneSplitter:
     def _split_long_text(
         self, text: str, start_timestamp: str, end_timestamp: str, max_tokens: int
     ) -> list[SceneSegment]:
-        encoded = self.embedder.encoding.encode(text)
+        encoded = self.embedder.encoding.encode_ordinary(text)
         total_tokens = len(encoded)
 
         if total_tokens <= max_tokens:
@@ -94,10 +96,8 @@ class SceneSplitter:
         return scenes
 
     def _calculate_token_prefix_sum(self, texts: list[str]) -> list[int]:
-        token_prefix = [0]
-        for t in texts:
-            token_prefix.append(token_prefix[-1] + self.embedder.count_tokens(t))
-        return token_prefix
+        counts = self.embedder.count_tokens_batch(texts)
+        return list(accumulate(counts, initial=0))
 
     def _split_scene_recursive(
         self,
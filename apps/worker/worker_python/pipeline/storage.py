@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 
@@ -22,7 +23,9 @@ def object_storage_key(file_key: str) -> str:
     return f"media/{normalized}"
 
 
+@functools.lru_cache(maxsize=1)
 def _s3_client():
+    """One client per process: boto3 clients are thread-safe and pool connections."""
     import boto3
     from botocore.config import Config
 
@@ -110,6 +113,35 @@ def delete_object(file_key: str) -> None:
         logger.warning("Failed to delete local media %s: %s", path, exc)
 
 
+# S3 DeleteObjects accepts at most 1000 keys per request (R2/MinIO follow suit).
+DELETE_OBJECTS_BATCH_SIZE = 1000
+
+
+def delete_objects(file_keys: list[str]) -> None:
+    """Delete many objects, one DeleteObjects request per 1000 keys."""
+    keys = [k for k in file_keys if k]
+    if not keys:
+        return
+    if not _use_object_storage():
+        for file_key in keys:
+            delete_object(file_key)
+        return
+
+    client = _s3_client()
+    bucket = _bucket()
+    for start in range(0, len(keys), DELETE_OBJECTS_BATCH_SIZE):
+        chunk = [object_storage_key(k) for k in keys[start : start + DELETE_OBJECTS_BATCH_SIZE]]
+        logger.info("Deleting %d objects from s3://%s", len(chunk), bucket)
+        response = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+        )
+        for error in response.get("Errors", []):
+            logger.warning(
+                "Failed to delete s3://%s/%s: %s", bucket, error.get("Key"), error.get("Message")
+            )
+
+
 def get_object_size(file_key: str) -> int:
     if _use_object_storage():
         client = _s3_client()
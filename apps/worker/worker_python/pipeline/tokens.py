@@ -0,0 +1,64 @@
+"""tiktoken helpers shared by scene splitting and embedding requests."""
+
+from __future__ import annotations
+
+import functools
+import logging
+
+import tiktoken
+
+from worker_python.env import env_str
+
+logger = logging.getLogger(__name__)
+
+# BPE never emits more tokens than UTF-8 bytes, so shorter inputs skip encoding.
+# Longer inputs are clipped to this many chars per token before encoding so
+# tiktoken's superlinear worst case is bounded by the limit, not the input.
+_CLIP_CHARS_PER_TOKEN = 8
+# Sparse text (whitespace/punctuation runs) can fit in the limit after the first
+# clip; the window doubles up to this factor, then the tail is dropped.
+_MAX_CLIP_WIDENING = 4
+
+
+@functools.lru_cache(maxsize=8)
+def get_encoding(provider: str, model: str) -> tiktoken.Encoding:
+    """Encodings are immutable; build each BPE table once per process."""
+    if provider == "openai":
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            logger.info("tiktoken has no encoding for %s; using cl100k_base", model)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def resolve_encoding() -> tiktoken.Encoding:
+    provider = env_str("EMBEDDING_PROVIDER", "openai").lower()
+    model = env_str("EMBEDDING_MODEL", "text-embedding-3-small")
+    return get_encoding(provider, model)
+
+
+def truncate_text_to_token_limit(
+    text: str, max_tokens: int, encoding: tiktoken.Encoding | None = None
+) -> str:
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    enc = encoding or resolve_encoding()
+    window = max_tokens * _CLIP_CHARS_PER_TOKEN
+    max_window = window * _MAX_CLIP_WIDENING
+    while True:
+        clipped = text[:window]
+        tokens = enc.encode_ordinary(clipped)
+        if len(tokens) > max_tokens:
+            return enc.decode(tokens[:max_tokens])
+        if len(clipped) == len(text):
+            return text
+        if window >= max_window:
+            logger.info(
+                "Dropped %d chars past the %d-char tokenizer window (%d/%d tokens)",
+                len(text) - len(clipped),
+                window,
+                len(tokens),
+                max_tokens,
+            )
+            return clipped
+        window *= 2
@@ -13,6 +13,7 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from worker_python.env import env_str, heavy_pipeline_enabled
+from worker_python.pipeline.openai_clients import get_openai_client
 from worker_python.pipeline.scene_otsu import apply_scene_splitting
 from worker_python.pipeline.srt import create_srt_from_whisper_segments, format_srt_time
 from worker_python.pipeline.storage import download_to_path
@@ -99,20 +100,18 @@ def _ffmpeg_extract_mp3(video_path: Path, audio_path: Path) -> None:
 
 
 def _whisper_transcribe(audio_path: Path) -> list[dict[str, Any]]:
-    from openai import OpenAI
-
     backend = env_str("WHISPER_BACKEND", "openai").lower()
     if backend in {"whisper.cpp", "local"}:
-        client = OpenAI(
-            api_key=env_str("OPENAI_API_KEY") or "dummy-key-for-local",
-            base_url=env_str("WHISPER_LOCAL_URL", "http://127.0.0.1:8080"),
+        client = get_openai_client(
+            env_str("OPENAI_API_KEY") or "dummy-key-for-local",
+            env_str("WHISPER_LOCAL_URL", "http://127.0.0.1:8080"),
         )
         model = "whisper-local"
     else:
         api_key = env_str("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is required for OpenAI Whisper")
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         model = "whisper-1"
 
     # Whisper API soft limit ~25MB; split longer audio into ~10min chunks if needed.
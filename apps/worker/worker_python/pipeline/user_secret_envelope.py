@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import base64
 import binascii
+import functools
 import os
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
-def _decode_base64url(value: str, *, field: str) -> bytes:
+def _decode_base64url(value: str | bytes, *, field: str) -> bytes:
     try:
-        encoded = value.encode("ascii")
+        encoded = value.encode("ascii") if isinstance(value, str) else value
         padded = encoded + (b"=" * (-len(encoded) % 4))
         return base64.b64decode(padded, altchars=b"-_", validate=True)
     except (UnicodeEncodeError, binascii.Error) as exc:
@@ -33,12 +34,16 @@ class UserSecretEnvelope:
 
     def decrypt(self, envelope: str | bytes | memoryview) -> str:
         if isinstance(envelope, str):
-            value = envelope
-        else:
-            value = bytes(envelope).decode("ascii")
+            try:
+                envelope = envelope.encode("ascii")
+            except UnicodeEncodeError as exc:
+                raise ValueError("user-secret envelope must be valid base64url") from exc
+        return self.decrypt_bytes(envelope).decode("utf-8")
 
-        parts = value.split(".")
-        if len(parts) != 3 or parts[0] != "v1":
+    def decrypt_bytes(self, envelope: bytes | memoryview) -> bytes:
+        """Decrypt an envelope already held as bytes, returning raw plaintext."""
+        parts = bytes(envelope).split(b".")
+        if len(parts) != 3 or parts[0] != b"v1":
             raise ValueError("user-secret envelope must use the v1 format")
 
         nonce = _decode_base64url(parts[1], field="nonce")
@@ -48,7 +53,13 @@ class UserSecretEnvelope:
         if len(ciphertext_and_tag) < 16:
             raise ValueError("AES-GCM ciphertext must include a 16-byte authentication tag")
 
-        return self._aesgcm.decrypt(nonce, ciphertext_and_tag, None).decode("utf-8")
+        return self._aesgcm.decrypt(nonce, ciphertext_and_tag, None)
+
+
+@functools.lru_cache(maxsize=1)
+def _envelope_for_key(encoded_key: str) -> UserSecretEnvelope:
+    """Decode the key and build the AESGCM cipher once per configured key."""
+    return UserSecretEnvelope(encoded_key)
 
 
 def try_decrypt(envelope: str | bytes | memoryview | None) -> str | None:
@@ -57,6 +68,7 @@ def try_decrypt(envelope: str | bytes | memoryview | None) -> str | None:
     if not envelope or (not isinstance(envelope, str) and not bytes(envelope)):
         return None
     try:
-        return UserSecretEnvelope().decrypt(envelope)
+        key_value = os.environ.get("USER_SECRET_ENCRYPTION_KEY", "")
+        return _envelope_for_key(key_value).decrypt(envelope)
     except (RuntimeError, ValueError, InvalidTag, UnicodeError):
         return None
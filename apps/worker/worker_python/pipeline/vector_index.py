@@ -12,7 +12,7 @@ from langchain_postgres import PGEngine, PGVectorStore
 
 from worker_python.db import db_connection, get_database_url
 from worker_python.env import env_str
-from worker_python.pipeline.embeddings import embed_texts
+from worker_python.pipeline.embeddings import embed_in_batches, embed_texts
 from worker_python.pipeline.srt import parse_srt_scenes
 from worker_python.video_sql import VideoRow
 
@@ -118,10 +118,7 @@ def index_video_transcript(video: VideoRow) -> int:
 
     texts = [s.text for s in scenes]
     # Batch embeddings in chunks to avoid provider limits.
-    embeddings: list[list[float]] = []
-    batch_size = 64
-    for i in range(0, len(texts), batch_size):
-        embeddings.extend(embed_texts(texts[i : i + batch_size]))
+    embeddings = embed_in_batches(texts, 64)
 
     metadatas = [
         {
@@ -6,8 +6,8 @@ import logging
 
 from worker_python.db import db_connection
 from worker_python.pipeline import vector_index
-from worker_python.pipeline.storage import delete_object
-from worker_python.video_sql import delete_video_cascade
+from worker_python.pipeline.storage import delete_objects
+from worker_python.video_sql import delete_videos_cascade
 
 logger = logging.getLogger(__name__)
 
@@ -17,22 +17,18 @@ def _delete_all_videos_for_user(conn, user_id: int) -> None:
         "SELECT id, file FROM videos WHERE user_id = %s ORDER BY id",
         (user_id,),
     ).fetchall()
-
-    for row in rows:
-        video_id = int(row["id"])
-        file_key = row.get("file") or None
-        try:
-            vector_index.delete_video_vectors(video_id)
-        except Exception:
-            logger.exception("Vector delete failed for video %d", video_id)
-        delete_video_cascade(conn, video_id, user_id)
-        if file_key:
-            try:
-                delete_object(str(file_key))
-            except Exception:
-                logger.exception(
-                    "Storage delete failed for video %d file=%r", video_id, file_key
-                )
+    if not rows:
+        return
+
+    # Vectors go in one user-scoped delete in _delete_remaining_vectors_for_user.
+    video_ids = [int(row["id"]) for row in rows]
+    delete_videos_cascade(conn, video_ids, user_id)
+
+    file_keys = [str(row["file"]) for row in rows if row.get("file")]
+    try:
+        delete_objects(file_keys)
+    except Exception:
+        logger.exception("Storage delete failed for user %d (%d files)", user_id, len(file_keys))
 
 
 def _delete_chat_history_for_user(conn, user_id: int) -> None:
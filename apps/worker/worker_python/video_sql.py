@@ -108,31 +108,45 @@ def delete_video_cascade(
     Hard-delete a video and related rows from the modern VideoQ schema.
     The schema has no ON DELETE CASCADE, so dependencies are removed explicitly.
     """
-    conn.execute("SELECT 1 FROM videos WHERE id = %s FOR UPDATE", (video_id,))
+    delete_videos_cascade(conn, [video_id], user_id)
+
+
+def delete_videos_cascade(
+    conn: psycopg.Connection[Any], video_ids: list[int], user_id: int
+) -> None:
+    """Cascade-delete many videos of one user with one statement per table."""
+    if not video_ids:
+        return
+    ids = list(video_ids)
+    conn.execute(
+        "SELECT 1 FROM videos WHERE id = ANY(%s) ORDER BY id FOR UPDATE", (ids,)
+    )
 
     conn.execute(
         """
         DELETE FROM learner_concept_states
-         WHERE concept_id IN (SELECT id FROM plog_concepts WHERE video_id = %s)
+         WHERE concept_id IN (SELECT id FROM plog_concepts WHERE video_id = ANY(%s))
         """,
-        (video_id,),
+        (ids,),
     )
     conn.execute(
         """
         DELETE FROM plog_learning_objects
-         WHERE concept_id IN (SELECT id FROM plog_concepts WHERE video_id = %s)
+         WHERE concept_id IN (SELECT id FROM plog_concepts WHERE video_id = ANY(%s))
         """,
-        (video_id,),
+        (ids,),
     )
-    conn.execute("DELETE FROM plog_edges WHERE video_id = %s", (video_id,))
-    conn.execute("DELETE FROM plog_concepts WHERE video_id = %s", (video_id,))
-    conn.execute("DELETE FROM plog_summary_nodes WHERE video_id = %s", (video_id,))
-    conn.execute("DELETE FROM plog_build_jobs WHERE video_id = %s", (video_id,))
-    conn.execute("DELETE FROM video_tags WHERE video_id = %s", (video_id,))
-    conn.execute("DELETE FROM video_group_members WHERE video_id = %s", (video_id,))
+    for table in (
+        "plog_edges",
+        "plog_concepts",
+        "plog_summary_nodes",
+        "plog_build_jobs",
+        "video_tags",
+        "video_group_members",
+    ):
+        conn.execute(f"DELETE FROM {table} WHERE video_id = ANY(%s)", (ids,))
     conn.execute(
-        "DELETE FROM videos WHERE id = %s AND user_id = %s",
-        (video_id, user_id),
+        "DELETE FROM videos WHERE id = ANY(%s) AND user_id = %s",
+        (ids, user_id),
     )
-    logger.info("Deleted video %d (user %d) and related rows", video_id, user_id)
-
+    logger.info("Deleted %d videos (user %d) and related rows", len(ids), user_id)